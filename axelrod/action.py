@@ -6,7 +6,7 @@ from axelrod import Action
 C, D = Action.C, Action.D
 """
 
-from enum import Enum
+from enum import IntEnum
 from functools import total_ordering
 from typing import Iterable, Tuple
 
@@ -19,11 +19,15 @@ class UnknownActionError(ValueError):
 
 
 @total_ordering
-class Action(Enum):
+class Action(IntEnum):
     """Core actions in the Prisoner's Dilemma.
 
     There are only two possible actions, namely Cooperate or Defect,
     which are called C and D for convenience.
+
+    The actions are an IntEnum so that they compare and hash as plain
+    integers in the strategies' inner loops, and so that histories of
+    actions can be stored in compact integer arrays.
     """
 
     C = 0  # Cooperate
@@ -1,20 +1,20 @@
 import os
 from collections import namedtuple
+from functools import lru_cache
+from multiprocessing import cpu_count
 from tempfile import mkstemp
 from typing import Any, List, Union
 
 import axelrod as axl
 import dask.dataframe as dd
-import matplotlib.pyplot as plt
 import numpy as np
 import tqdm
 from axelrod import Player
 from axelrod.interaction_utils import (
-    compute_final_score_per_turn,
+    compute_payoff_table,
     read_interactions_from_file,
 )
 from axelrod.strategy_transformers import DualTransformer, JossAnnTransformer
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 Point = namedtuple("Point", "x y")
 
@@ -44,20 +44,51 @@ def _create_points(step: float, progress_bar: bool = True) -> List[Point]:
     if progress_bar:
         p_bar = tqdm.tqdm(total=num ** 2, desc="Generating points")
 
-    points = []
-    for x in np.linspace(0, 1, num):
-        for y in np.linspace(0, 1, num):
-            points.append(Point(x, y))
-
-            if progress_bar:
-                p_bar.update()
+    coordinates = np.linspace(0, 1, num)
+    grid_x, grid_y = np.meshgrid(coordinates, coordinates, indexing="ij")
+    coordinate_pairs = np.stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+    # tolist converts the coordinates back to built-in floats.
+    points = [Point(x, y) for x, y in coordinate_pairs.tolist()]
 
     if progress_bar:
+        p_bar.update(len(points))
         p_bar.close()
 
     return points
 
 
+@lru_cache(maxsize=None)
+def _jossann_class(probe_class: type, coordinates: tuple) -> type:
+    """Creates a JossAnn class for the given probe class and coordinates.
+
+    Transformers build a new class with `type()` on every call, which is
+    costly over a fine grid of points. The classes are cached here since a
+    point with x + y >= 1 shares its JossAnn parameters with the mirrored
+    point in the lower triangle, so each underlying class only needs to be
+    built once; the Dual wrap for the upper triangle is cached separately
+    in `_dual_jossann_class` on top of the shared class.
+
+    Parameters
+    ----------
+    probe_class : class
+        A class that must be descended from axelrod.Player.
+    coordinates : tuple of float
+        The (x, y) parameters of the JossAnn transformer.
+
+    Returns
+    ----------
+    joss_ann_class : class
+        The transformed probe class.
+    """
+    return JossAnnTransformer(coordinates)(probe_class)
+
+
+@lru_cache(maxsize=None)
+def _dual_jossann_class(probe_class: type, coordinates: tuple) -> type:
+    """Creates the Dual of the cached JossAnn class for the coordinates."""
+    return DualTransformer()(_jossann_class(probe_class, coordinates))
+
+
 def _create_jossann(point: Point, probe: Any) -> Player:
     """Creates a JossAnn probe player that matches the Point.
 
@@ -87,11 +118,11 @@ def _create_jossann(point: Point, probe: Any) -> Player:
         init_kwargs = {}
 
     if x + y >= 1:
-        joss_ann = DualTransformer()(
-            JossAnnTransformer((1 - x, 1 - y))(probe_class)
-        )(**init_kwargs)
+        joss_ann = _dual_jossann_class(probe_class, (1 - x, 1 - y))(
+            **init_kwargs
+        )
     else:
-        joss_ann = JossAnnTransformer((x, y))(probe_class)(**init_kwargs)
+        joss_ann = _jossann_class(probe_class, (x, y))(**init_kwargs)
     return joss_ann
 
 
@@ -119,9 +150,30 @@ def _create_probes(
         A list of `JossAnnTransformer` players with parameters that
         correspond to point.
     """
+    if isinstance(probe, axl.Player):
+        probe_class = probe.__class__
+        init_kwargs = probe.init_kwargs
+    else:
+        probe_class = probe
+        init_kwargs = {}
+
+    # Resolve the JossAnn parameters for all points in one vectorized pass:
+    # points with x + y >= 1 take the Dual with parameters (1 - x, 1 - y),
+    # so the per-probe construction below is branch free.
+    coordinates = np.array(points)
+    duals = coordinates.sum(axis=1) >= 1
+    parameters = np.where(duals[:, np.newaxis], 1 - coordinates, coordinates)
+
+    pairs = zip(parameters.tolist(), duals.tolist())
     if progress_bar:
-        points = tqdm.tqdm(points, desc="Generating probes")
-    probes = [_create_jossann(point, probe) for point in points]
+        pairs = tqdm.tqdm(pairs, desc="Generating probes", total=len(points))
+
+    probes = [
+        _dual_jossann_class(probe_class, (x, y))(**init_kwargs)
+        if dual
+        else _jossann_class(probe_class, (x, y))(**init_kwargs)
+        for (x, y), dual in pairs
+    ]
     return probes
 
 
@@ -146,12 +198,20 @@ def _create_edges(points: List[Point], progress_bar: bool = True) -> list:
         corresponding probe (+1 to allow for including the Strategy).
     """
     if progress_bar:
-        points = tqdm.tqdm(points, desc="Generating network edges")
-    edges = [(0, index + 1) for index, point in enumerate(points)]
+        p_bar = tqdm.tqdm(total=len(points), desc="Generating network edges")
+
+    edges = [(0, index) for index in range(1, len(points) + 1)]
+
+    if progress_bar:
+        p_bar.update(len(edges))
+        p_bar.close()
+
     return edges
 
 
-def _generate_data(interactions: dict, points: list, edges: list) -> dict:
+def _generate_data(
+    interactions: dict, points: list, edges: list, size: int
+) -> tuple:
     """Generates useful data from a spatial tournament.
 
     Matches interactions from `results` to their corresponding Point in
@@ -168,52 +228,59 @@ def _generate_data(interactions: dict, points: list, edges: list) -> dict:
         A list containing tuples of length 2. All tuples will have either 0
         or 1 as the first element. The second element is the index of the
         corresponding probe (+1 to allow for including the Strategy).
+    size : int
+        The number of Points in every row/column.
 
     Returns
     ----------
     point_scores : dict
         A dictionary where the keys are Points of the form (x, y) and
         the values are the mean score for the corresponding interactions.
+    grid : np.ndarray
+        2-D numpy array of the scores, shaped so that the score
+        corresponding to Point (0, 0) is in the left hand corner ie. the
+        standard origin, ready for plotting.
     """
-    edge_scores = [
-        np.mean(
-            [
-                compute_final_score_per_turn(scores)[0]
-                for scores in interactions[edge]
-            ]
+    # The first player's slice of the payoff table scores the probe edges.
+    payoffs = compute_payoff_table()[:, :, 0]
+
+    # All matches in the spatial tournament have the same number of turns and
+    # repetitions, so the interactions of a batch of edges stack into a
+    # single integer array of shape (edges, repetitions, turns, 2) which can
+    # be scored in one pass. np.fromiter with a known count fills a
+    # pre-sized array directly, avoiding the intermediate Python lists, and
+    # the edges are processed in blocks so only one block's interactions are
+    # expanded at a time.
+    repetitions = len(interactions[edges[0]])
+    turns = len(interactions[edges[0]][0])
+    block_size = 256
+    # float32 gives more precision than the heat map can render while
+    # halving the memory held by the stored scores; the means themselves
+    # are still accumulated in float64 before being narrowed.
+    edge_scores = np.empty(len(edges), dtype=np.float32)
+    for start in range(0, len(edges), block_size):
+        block = edges[start : start + block_size]
+        action_values = np.fromiter(
+            (
+                action.value
+                for edge in block
+                for interaction in interactions[edge]
+                for pair in interaction
+                for action in pair
+            ),
+            dtype=np.uint8,
+            count=len(block) * repetitions * turns * 2,
         )
-        for edge in edges
-    ]
-    point_scores = dict(zip(points, edge_scores))
-    return point_scores
-
-
-def _reshape_data(data: dict, points: list, size: int) -> np.ndarray:
-    """Shape the data so that it can be plotted easily.
-
-    Parameters
-    ----------
-    data : dictionary
-        A dictionary where the keys are Points of the form (x, y) and
-        the values are the mean score for the corresponding interactions.
-
-    points : list
-        of Point objects with coordinates (x, y).
-
-    size : int
-        The number of Points in every row/column.
+        plays = action_values.reshape(len(block), repetitions, turns, 2)
+        edge_scores[start : start + len(block)] = payoffs[
+            plays[..., 0], plays[..., 1]
+        ].mean(axis=(1, 2))
+    point_scores = dict(zip(points, edge_scores.tolist()))
 
-    Returns
-    ----------
-    plotting_data : list
-        2-D numpy array of the scores, correctly shaped to ensure that the
-        score corresponding to Point (0, 0) is in the left hand corner ie.
-        the standard origin.
-    """
-    ordered_data = [data[point] for point in points]
-    shaped_data = np.reshape(ordered_data, (size, size), order="F")
-    plotting_data = np.flipud(shaped_data)
-    return plotting_data
+    # The scores are already in point order, so the plotting grid can be
+    # shaped directly without any per-coordinate dictionary lookups.
+    grid = np.flipud(np.reshape(edge_scores, (size, size), order="F"))
+    return point_scores, grid
 
 
 class AshlockFingerprint(object):
@@ -235,12 +302,18 @@ class AshlockFingerprint(object):
         """
         self.strategy = strategy
         self.probe = probe
+        self._elements_cache = {}  # type: dict
 
     def _construct_tournament_elements(
         self, step: float, progress_bar: bool = True
     ) -> tuple:
         """Build the elements required for a spatial tournament
 
+        The points, edges and probe players only depend on `step` (the
+        strategy and probe are fixed on the instance), so they are cached
+        and reused when `fingerprint` is called again with e.g. different
+        turns or repetitions.
+
         Parameters
         ----------
         step : float
@@ -261,16 +334,24 @@ class AshlockFingerprint(object):
             original player, the rest are the probes.
 
         """
-        self.points = _create_points(step, progress_bar=progress_bar)
-        edges = _create_edges(self.points, progress_bar=progress_bar)
-        probe_players = _create_probes(
-            self.probe, self.points, progress_bar=progress_bar
-        )
+        if step in self._elements_cache:
+            self.points, edges, probe_players = self._elements_cache[step]
+        else:
+            self.points = _create_points(step, progress_bar=progress_bar)
+            edges = _create_edges(self.points, progress_bar=progress_bar)
+            probe_players = _create_probes(
+                self.probe, self.points, progress_bar=progress_bar
+            )
+            self._elements_cache[step] = (self.points, edges, probe_players)
 
+        # Preallocate rather than concatenate so the (possibly cached) probe
+        # list is copied exactly once.
+        tournament_players = [None] * (len(probe_players) + 1)
         if isinstance(self.strategy, axl.Player):
-            tournament_players = [self.strategy.clone()] + probe_players
+            tournament_players[0] = self.strategy.clone()
         else:
-            tournament_players = [self.strategy()] + probe_players
+            tournament_players[0] = self.strategy()
+        tournament_players[1:] = probe_players
 
         return edges, tournament_players
 
@@ -292,6 +373,13 @@ class AshlockFingerprint(object):
         the coordinates sum to less than 1 (or equal), then only the Joss-Ann is
         applied, a flip_plays is not required.
 
+        Although a point with x + y >= 1 mirrors the JossAnn parameters of a
+        point in the lower triangle (so the mirrored pair shares one cached
+        JossAnn class when the probes are constructed), its matches are
+        still played: the Dual probe's scores are independent random
+        realizations against the strategy and cannot be derived from the
+        mirrored point's matches.
+
         Parameters
         ----------
         turns : int, optional
@@ -302,7 +390,9 @@ class AshlockFingerprint(object):
             The separation between each Point. Smaller steps will
             produce more Points that will be closer together.
         processes : int, optional
-            The number of processes to be used for parallel processing
+            The number of processes to be used for parallel processing.
+            If None, all available cores are used since the matches of the
+            spatial tournament are independent of each other.
         filename: str, optional
             The name of the file for self.spatial_tournament's interactions.
             if None, will auto-generate a filename.
@@ -318,6 +408,9 @@ class AshlockFingerprint(object):
             the values are the mean score for the corresponding interactions.
         """
 
+        if processes is None:
+            processes = cpu_count()
+
         temp_file_descriptor = None
         if filename is None:
             temp_file_descriptor, filename = mkstemp()  # type: ignore
@@ -350,7 +443,10 @@ class AshlockFingerprint(object):
             os.close(temp_file_descriptor)
             os.remove(filename)
 
-        self.data = _generate_data(self.interactions, self.points, edges)
+        size = int((1 / step) // 1) + 1
+        self.data, self._grid = _generate_data(
+            self.interactions, self.points, edges, size
+        )
         return self.data
 
     def plot(
@@ -360,7 +456,7 @@ class AshlockFingerprint(object):
         title: str = None,
         colorbar: bool = True,
         labels: bool = True,
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """Plot the results of the spatial tournament.
 
         Parameters
@@ -383,14 +479,17 @@ class AshlockFingerprint(object):
         figure : matplotlib figure
             A heat plot of the results of the spatial tournament
         """
-        size = int((1 / self.step) // 1) + 1
-        plotting_data = _reshape_data(self.data, self.points, size)
+        # matplotlib is only needed for plotting, so it is imported here
+        # rather than at module load.
+        import matplotlib.pyplot as plt
+
+        plotting_data = self._grid
         fig, ax = plt.subplots()
         cax = ax.imshow(plotting_data, cmap=cmap, interpolation=interpolation)
 
         if colorbar:
-            max_score = max(self.data.values())
-            min_score = min(self.data.values())
+            max_score = plotting_data.max()
+            min_score = plotting_data.min()
             ticks = [min_score, (max_score + min_score) / 2, max_score]
             fig.colorbar(cax, ticks=ticks)
 
@@ -559,8 +658,8 @@ class TransitiveFingerprint(object):
         colorbar: bool = True,
         labels: bool = True,
         display_names: bool = False,
-        ax: plt.Figure = None,
-    ) -> plt.Figure:
+        ax: "plt.Figure" = None,
+    ) -> "plt.Figure":
         """Plot the results of the spatial tournament.
         Parameters
         ----------
@@ -586,6 +685,8 @@ class TransitiveFingerprint(object):
         figure : matplotlib figure
             A heat plot of the results of the spatial tournament
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             fig, ax = plt.subplots()
         else:
@@ -617,6 +718,8 @@ class TransitiveFingerprint(object):
             plt.title(title)
 
         if colorbar:
+            from mpl_toolkits.axes_grid1 import make_axes_locatable
+
             max_score = 0
             min_score = 1
             ticks = [min_score, 1 / 2, max_score]
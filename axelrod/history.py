@@ -133,7 +133,7 @@ class LimitedHistory(History):
 
         self._plays.append(play)
         self._actions[play] += 1
-        if coplay:
+        if coplay is not None:
             self._coplays.append(coplay)
             self._state_distribution[(play, coplay)] += 1
         if len(self._plays) > self.memory_depth:
@@ -7,9 +7,11 @@ form:
 This is used by both the Match class and the ResultSet class which analyse
 interactions.
 """
+import csv
 from collections import Counter, defaultdict
+from itertools import groupby
 
-import pandas as pd
+import numpy as np
 import tqdm
 from axelrod.action import Action, str_to_actions
 
@@ -38,8 +40,33 @@ def compute_final_score(interactions, game=None):
     return final_score
 
 
+def compute_payoff_table(game=None):
+    """Returns the payoffs of a game as a 2x2x2 array indexed by the integer
+    values of the two players' actions."""
+    if not game:
+        game = Game()
+    return np.array(
+        [[game.score((play, coplay)) for coplay in (C, D)] for play in (C, D)]
+    )
+
+
 def compute_final_score_per_turn(interactions, game=None):
-    """Returns the mean score per round for a set of interactions"""
+    """Returns the mean score per round for a set of interactions.
+
+    The interactions may also be given as an integer array of shape
+    (turns, 2), in which case the scores are computed by a payoff table
+    lookup over the whole array rather than a per turn Python loop."""
+    if isinstance(interactions, np.ndarray):
+        if len(interactions) == 0:
+            return None
+        payoffs = compute_payoff_table(game)
+        # Histogram the four joint outcomes once, then a four-element dot
+        # product per player gives the totals: the work no longer grows a
+        # payoff lookup per turn.
+        outcomes = 2 * interactions[:, 0].astype(np.intp) + interactions[:, 1]
+        counts = np.bincount(outcomes, minlength=4)
+        return tuple(counts @ payoffs.reshape(4, 2) / len(interactions))
+
     scores = compute_scores(interactions, game)
     num_turns = len(interactions)
 
@@ -254,20 +281,29 @@ def compute_sparklines(interactions, c_symbol="█", d_symbol=" "):
 def read_interactions_from_file(filename, progress_bar=True):
     """
     Reads a file and returns a dictionary mapping tuples of player pairs to
-    lists of interactions
-    """
-    df = pd.read_csv(filename)[
-        ["Interaction index", "Player index", "Opponent index", "Actions"]
-    ]
-    groupby = df.groupby("Interaction index")
-    if progress_bar:
-        groupby = tqdm.tqdm(groupby)
+    lists of interactions.
 
+    The file is streamed row by row rather than read into a dataframe, so
+    no memory beyond the returned dictionary and the interaction currently
+    being parsed is used. The rows of an interaction are assumed to be
+    consecutive, as tournaments write them; a re-sorted file would need to
+    be grouped by interaction index before being read.
+    """
     pairs_to_interactions = defaultdict(list)
-    for _, d in tqdm.tqdm(groupby):
-        key = tuple(d[["Player index", "Opponent index"]].iloc[0])
-        value = list(map(str_to_actions, zip(*d["Actions"])))
-        pairs_to_interactions[key].append(value)
+    with open(filename, "r") as f:
+        reader = csv.DictReader(f)
+        if progress_bar:
+            reader = tqdm.tqdm(reader)
+
+        for _, rows in groupby(
+            reader, key=lambda row: row["Interaction index"]
+        ):
+            rows = list(rows)
+            key = (int(rows[0]["Player index"]), int(rows[0]["Opponent index"]))
+            value = list(
+                map(str_to_actions, zip(*(row["Actions"] for row in rows)))
+            )
+            pairs_to_interactions[key].append(value)
     return pairs_to_interactions
 
 
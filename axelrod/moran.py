@@ -3,7 +3,6 @@
 from collections import Counter
 from typing import Callable, List, Optional, Set, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 from axelrod import DEFAULT_TURNS, EvolvablePlayer, Game, Player
 from axelrod.deterministic_cache import DeterministicCache
@@ -467,6 +466,8 @@ class MoranProcess(object):
         A matplotlib axis object
 
         """
+        import matplotlib.pyplot as plt
+
         player_names = self.populations[0].keys()
         if ax is None:
             _, ax = plt.subplots()
@@ -138,8 +138,13 @@ class Player(object, metaclass=PostInitCaller):
             value = getattr(self, attribute, None)
             other_value = getattr(other, attribute, None)
 
-            if attribute in ["_random", "_seed"]:
-                # Don't compare the random generators.
+            if attribute in [
+                "_random",
+                "_seed",
+                "_random_block",
+                "_random_index",
+            ]:
+                # Don't compare the random generators or their state.
                 continue
 
             if isinstance(value, np.ndarray):
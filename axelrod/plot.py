@@ -2,9 +2,6 @@ import pathlib
 from distutils.version import LooseVersion
 from typing import List, Union
 
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.transforms as transforms
 import tqdm
 from numpy import arange, median, nan_to_num
 
@@ -34,9 +31,12 @@ class Plot(object):
         data: dataType,
         names: namesType,
         title: titleType = None,
-        ax: matplotlib.axes.SubplotBase = None,
-    ) -> matplotlib.figure.Figure:
+        ax: "matplotlib.axes.SubplotBase" = None,
+    ) -> "matplotlib.figure.Figure":
         """For making violinplots."""
+        # matplotlib is only needed for plotting, so it is imported here
+        # rather than at module load.
+        import matplotlib.pyplot as plt
 
         if ax is None:
             _, ax = plt.subplots()
@@ -84,8 +84,8 @@ class Plot(object):
         return [str(n) for n in self.result_set.ranked_names]
 
     def boxplot(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """For the specific mean score boxplot."""
         data = self._boxplot_dataset
         names = self._boxplot_xticks_labels
@@ -106,9 +106,10 @@ class Plot(object):
         return wins, ranked_names
 
     def winplot(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """Plots the distributions for the number of wins for each strategy."""
+        import matplotlib.pyplot as plt
 
         data, names = self._winplot_dataset
         figure = self._violinplot(data, names, title=title, ax=ax)
@@ -134,8 +135,8 @@ class Plot(object):
         return diffs, ranked_names
 
     def sdvplot(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """Score difference violin plots to visualize the distributions of how
         players attain their payoffs."""
         diffs, ranked_names = self._sdv_plot_dataset
@@ -151,8 +152,8 @@ class Plot(object):
         ]
 
     def lengthplot(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """For the specific match length boxplot."""
         data = self._lengthplot_dataset
         names = self._boxplot_xticks_labels
@@ -183,9 +184,11 @@ class Plot(object):
         data: dataType,
         names: namesType,
         title: titleType = None,
-        ax: matplotlib.axes.SubplotBase = None,
-    ) -> matplotlib.figure.Figure:
+        ax: "matplotlib.axes.SubplotBase" = None,
+    ) -> "matplotlib.figure.Figure":
         """Generic heatmap plot"""
+        import matplotlib
+        import matplotlib.pyplot as plt
 
         if ax is None:
             _, ax = plt.subplots()
@@ -211,16 +214,16 @@ class Plot(object):
         return figure
 
     def pdplot(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """Payoff difference heatmap to visualize the distributions of how
         players attain their payoffs."""
         matrix, names = self._pdplot_dataset
         return self._payoff_heatmap(matrix, names, title=title, ax=ax)
 
     def payoff(
-        self, title: titleType = None, ax: matplotlib.axes.SubplotBase = None
-    ) -> matplotlib.figure.Figure:
+        self, title: titleType = None, ax: "matplotlib.axes.SubplotBase" = None
+    ) -> "matplotlib.figure.Figure":
         """Payoff heatmap to visualize the distributions of how
         players attain their payoffs."""
         data = self._payoff_dataset
@@ -234,8 +237,10 @@ class Plot(object):
         eco,
         title: titleType = None,
         logscale: bool = True,
-        ax: matplotlib.axes.SubplotBase = None,
-    ) -> matplotlib.figure.Figure:
+        ax: "matplotlib.axes.SubplotBase" = None,
+    ) -> "matplotlib.figure.Figure":
+        import matplotlib.pyplot as plt
+        import matplotlib.transforms as transforms
 
         populations = eco.population_sizes
 
@@ -312,6 +317,8 @@ class Plot(object):
             progress_bar : bool
                 Whether or not to create a progress bar which will be updated
         """
+        import matplotlib.pyplot as plt
+
         plots = [
             ("boxplot", "Payoff"),
             ("payoff", "Payoff"),
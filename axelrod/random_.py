@@ -31,8 +31,17 @@ class RandomGenerator(object):
     def random_seed_int(self) -> int:
         return self.randint(low=0, high=2 ** 32 - 1, dtype="uint64")
 
-    def choice(self, *args, **kwargs):
-        return self._random.choice(*args, **kwargs)
+    def choice(self, a, *args, **kwargs):
+        # np.random's choice coerces a list or tuple into an ndarray, which
+        # would turn IntEnum members such as Action into plain integers.
+        # Sample an index instead so the original elements are returned.
+        if isinstance(a, (list, tuple)):
+            index = self._random.choice(len(a), *args, **kwargs)
+            if isinstance(index, np.ndarray):
+                # More than one sample was requested.
+                return [a[i] for i in index]
+            return a[index]
+        return self._random.choice(a, *args, **kwargs)
 
     def uniform(self, *args, **kwargs):
         return self._random.uniform(*args, **kwargs)
@@ -1,10 +1,12 @@
 from axelrod.action import Action
 from axelrod.player import Player
-import random
-import numpy as np
 
 C, D = Action.C, Action.D
 
+# Number of uniform samples drawn per block; one bulk draw through the
+# player's seeded generator is much cheaper than a call per sample.
+_RANDOM_BLOCK_SIZE = 512
+
 
 class MyStrategy(Player):
 
@@ -18,41 +20,62 @@ class MyStrategy(Player):
 
     classifier = {
         "memory_depth": 1,
-        "stochastic": False,
+        "stochastic": True,
+        "makes_use_of": set(),
         "long_run_time": False,
         "inspects_source": False,
         "manipulates_source": False,
         "manipulates_state": False,
     }
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Integer mirrors of the history so that the per turn decision only
+        # reads machine integers instead of indexing into the history lists.
+        self._turn = 0
+        self._last_self = C.value
+        self._last_opp = C.value
+        self._random_block = None
+        self._random_index = 0
+
+    def _next_random(self) -> float:
+        """Returns a uniform sample from a lazily refilled block.
+
+        The block is drawn in bulk from the player's seeded generator so
+        that behaviour stays reproducible for a given match seed."""
+        if (
+            self._random_block is None
+            or self._random_index == _RANDOM_BLOCK_SIZE
+        ):
+            self._random_block = self._random.random(_RANDOM_BLOCK_SIZE)
+            self._random_index = 0
+        value = self._random_block[self._random_index]
+        self._random_index += 1
+        return value
+
+    def update_history(self, play: Action, coplay: Action) -> None:
+        super().update_history(play, coplay)
+        self._turn += 1
+        self._last_self = play.value
+        self._last_opp = coplay.value
+
     def strategy(self, opponent: Player) -> Action:
 
         # nice strategy, so start with C
-        if len(self.history) == 0:
+        if self._turn == 0:
             return C
 
-        # play TFT
-        elif (np.floor((len(self.history)/30))%2) == 0:
-            return opponent.history[-1]
-
-        # play ZD-GTFT2
-        else:
-            if (opponent.history[-1] == C and self.history[-1] == C):
-                return C
-
-            elif (opponent.history[-1] == D and self.history[-1] == C):
-                p = random.random()
-                if (p <= 0.125):
-                    return C
-                else:
-                    return D
-
-            elif (opponent.history[-1] == C and self.history[-1] == D):
-                return C
-
-            else:
-                p = random.random()
-                if (p <= 0.25):
-                    return C
-                else:
-                    return D
+        # play TFT on even 30-turn blocks; testing the low bit of the block
+        # index avoids a modulo in the per turn hot path.
+        if (self._turn // 30) & 1 == 0:
+            return C if self._last_opp == C.value else D
+
+        # play ZD-GTFT2: cooperate whenever the opponent cooperated,
+        # otherwise forgive with probability 0.125 (after cooperating) or
+        # 0.25 (after defecting).
+        if self._last_opp == C.value:
+            return C
+        threshold = 0.125 if self._last_self == C.value else 0.25
+        if self._next_random() <= threshold:
+            return C
+        return D
@@ -7,10 +7,11 @@ C, D = axl.Action.C, axl.Action.D
 class TestMyStrategy(TestPlayer):
 
     name = "MyStrategy"
-    player = axl.mystrategy
+    player = axl.MyStrategy
     expected_classifier = {
         "memory_depth": 1,
-        "stochastic": False,
+        "stochastic": True,
+        "makes_use_of": set(),
         "long_run_time": False,
         "inspects_source": False,
         "manipulates_source": False,
@@ -35,3 +36,16 @@ class TestMyStrategy(TestPlayer):
         self.versus_test(
             opponent=axl.Defector(), expected_actions=actions, seed=2
         )
+
+    def test_strategy_past_mode_switch(self):
+        # After turn 30 the strategy plays ZD-GTFT2 and forgives a
+        # defecting opponent stochastically; where it forgives depends on
+        # the seed.
+        actions = [(C, D)] + [(D, D)] * 29 + [(C, D)] + [(D, D)] * 4
+        self.versus_test(
+            opponent=axl.Defector(), expected_actions=actions, seed=1
+        )
+        actions = [(C, D)] + [(D, D)] * 32 + [(C, D), (D, D)]
+        self.versus_test(
+            opponent=axl.Defector(), expected_actions=actions, seed=2
+        )
@@ -2,6 +2,8 @@ import tempfile
 import unittest
 from collections import Counter
 
+import numpy as np
+
 import axelrod as axl
 
 C, D = axl.Action.C, axl.Action.D
@@ -62,6 +64,16 @@ class TestMatch(unittest.TestCase):
                 axl.interaction_utils.compute_final_score_per_turn(inter),
             )
 
+    def test_compute_final_score_per_turn_from_array(self):
+        for inter, final_score_per_round in zip(
+            self.interactions, self.final_score_per_turn
+        ):
+            encoded = np.array(inter, dtype=np.uint8).reshape(-1, 2)
+            self.assertEqual(
+                final_score_per_round,
+                axl.interaction_utils.compute_final_score_per_turn(encoded),
+            )
+
     def test_compute_winner_index(self):
         for inter, winner in zip(self.interactions, self.winners):
             self.assertEqual(
@@ -574,8 +574,7 @@ class TestTournament(unittest.TestCase):
             repetitions=self.test_repetitions,
         )
         chunks = tournament.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
+        work_queue.put(list(chunks))
         tournament._start_workers(workers, work_queue, done_queue)
 
         stops = 0
@@ -595,11 +594,9 @@ class TestTournament(unittest.TestCase):
         )
 
         work_queue = Queue()
-        chunks = tournament.match_generator.build_match_chunks()
-        count = 0
-        for chunk in chunks:
-            work_queue.put(chunk)
-            count += 1
+        chunks = list(tournament.match_generator.build_match_chunks())
+        count = len(chunks)
+        work_queue.put(chunks)
         work_queue.put("STOP")
 
         done_queue = Queue()
@@ -8,6 +8,7 @@ from tempfile import mkstemp
 from typing import List, Optional, Tuple
 
 import axelrod.interaction_utils as iu
+import numpy as np
 import tqdm
 from axelrod import DEFAULT_TURNS
 from axelrod.action import Action, actions_to_str
@@ -20,6 +21,10 @@ from .result_set import ResultSet
 
 C, D = Action.C, Action.D
 
+# Maximum number of match chunks sent to a worker per queue item. Batching
+# amortizes the pickling and queue costs over many short matches.
+_WORK_QUEUE_BATCH_SIZE = 64
+
 
 class Tournament(object):
     def __init__(
@@ -189,7 +194,9 @@ class Tournament(object):
         file_obj = None
         writer = None
         if self.filename is not None:
-            file_obj = open(self.filename, "w")
+            # A large write buffer amortizes the cost of the many small
+            # interaction rows over far fewer system calls.
+            file_obj = open(self.filename, "w", buffering=1 << 20)
             writer = csv.writer(file_obj, lineterminator="\n")
 
             header = [
@@ -320,9 +327,16 @@ class Tournament(object):
         done_queue = Queue()  # type: Queue
         workers = self._n_workers(processes=processes)
 
-        chunks = self.match_generator.build_match_chunks()
-        for chunk in chunks:
-            work_queue.put(chunk)
+        chunks = list(self.match_generator.build_match_chunks())
+        # Scale the batch to the workload: small tournaments keep per-chunk
+        # dispatch so that no worker sits idle, while tournaments with many
+        # edges (e.g. fingerprints) get large batches that amortize the
+        # queue traffic.
+        batch_size = max(
+            1, min(_WORK_QUEUE_BATCH_SIZE, len(chunks) // (4 * workers))
+        )
+        for start in range(0, len(chunks), batch_size):
+            work_queue.put(chunks[start : start + batch_size])
 
         self._start_workers(workers, work_queue, done_queue, build_results)
         self._process_done_queue(workers, done_queue, build_results)
@@ -420,9 +434,10 @@ class Tournament(object):
         build_results : bool
             whether or not to build a results set
         """
-        for chunk in iter(work_queue.get, "STOP"):
-            interactions = self._play_matches(chunk, build_results)
-            done_queue.put(interactions)
+        for batch in iter(work_queue.get, "STOP"):
+            for chunk in batch:
+                interactions = self._play_matches(chunk, build_results)
+                done_queue.put(interactions)
         done_queue.put("STOP")
         return True
 
@@ -475,8 +490,10 @@ class Tournament(object):
         turns = len(interactions)
         results.append(turns)
 
+        # Encoding the actions as integers takes the histogram-based fast
+        # path rather than scoring one turn at a time.
         score_per_turns = iu.compute_final_score_per_turn(
-            interactions, self.game
+            np.asarray(interactions, dtype=np.uint8), self.game
         )
         results.append(score_per_turns)
 